@@ -5,6 +5,7 @@ Provides command-line interface for quick analysis
 """
 
 import sys
+import shlex
 import argparse
 from tabulate import tabulate
 from data_loader import DataLoader
@@ -12,12 +13,8 @@ from crypto_analyzer import CryptoAnalyzer
 from stock_analyzer import StockAnalyzer
 
 
-def crypto_command(args):
+def crypto_command(args, analyzer: CryptoAnalyzer):
     """Handle crypto analysis commands"""
-    loader = DataLoader()
-    crypto_data, _ = loader.load_all_data()
-    analyzer = CryptoAnalyzer(crypto_data)
-    
     if args.action == 'overview':
         overview = analyzer.get_market_overview()
         print("\nCryptocurrency Market Overview:")
@@ -62,12 +59,8 @@ def crypto_command(args):
             print(f"Error: Cryptocurrency '{args.symbol}' not found")
 
 
-def stock_command(args):
+def stock_command(args, analyzer: StockAnalyzer):
     """Handle stock analysis commands"""
-    loader = DataLoader()
-    _, stock_data = loader.load_all_data()
-    analyzer = StockAnalyzer(stock_data)
-    
     if args.action == 'overview':
         overview = analyzer.get_market_overview()
         print("\nStock Market Overview:")
@@ -115,6 +108,58 @@ def stock_command(args):
             print(f"Error: Stock '{args.name}' not found")
 
 
+def get_analyzer(command: str, loader: DataLoader, analyzers: dict):
+    """Create the analyzer for a command on first use and reuse it afterwards"""
+    if command not in analyzers:
+        if command == 'crypto':
+            analyzers[command] = CryptoAnalyzer(loader.load_crypto_data())
+        else:
+            analyzers[command] = StockAnalyzer(loader.load_stock_data())
+    return analyzers[command]
+
+
+def run_command(args, loader: DataLoader, analyzers: dict):
+    """Dispatch a parsed command to its handler"""
+    analyzer = get_analyzer(args.command, loader, analyzers)
+    if args.command == 'crypto':
+        crypto_command(args, analyzer)
+    elif args.command == 'stock':
+        stock_command(args, analyzer)
+
+
+def run_repl(parser: argparse.ArgumentParser, loader: DataLoader):
+    """Run commands interactively, keeping loaded data between commands"""
+    analyzers = {}
+    print("Interactive mode - enter commands such as 'crypto top -n 5' ('quit' to exit)")
+    
+    while True:
+        try:
+            line = input('fintech> ').strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            break
+        
+        if line in ('quit', 'exit'):
+            break
+        if not line:
+            continue
+        
+        try:
+            args = parser.parse_args(shlex.split(line))
+        except SystemExit:
+            # argparse already printed the usage error or help text
+            continue
+        
+        if not args.command:
+            parser.print_help()
+            continue
+        
+        try:
+            run_command(args, loader, analyzers)
+        except Exception as e:
+            print(f"\nError: {e}")
+
+
 def main():
     """Main CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -134,8 +179,13 @@ Examples:
   %(prog)s stock losers --number 10
   %(prog)s stock search --name Apple
   %(prog)s stock volatile --number 5
+  
+  # Interactive session (data is loaded once and reused)
+  %(prog)s --repl
         """
     )
+    parser.add_argument('--repl', action='store_true',
+                        help='Start an interactive session that reuses loaded data')
     
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
     
@@ -155,16 +205,18 @@ Examples:
     stock_parser.add_argument('--name', help='Stock name')
     
     args = parser.parse_args()
+    loader = DataLoader()
+    
+    if args.repl:
+        run_repl(parser, loader)
+        return
     
     if not args.command:
         parser.print_help()
         return
     
     try:
-        if args.command == 'crypto':
-            crypto_command(args)
-        elif args.command == 'stock':
-            stock_command(args)
+        run_command(args, loader, {})
     except Exception as e:
         print(f"\nError: {e}")
         sys.exit(1)
@@ -20,6 +20,41 @@ class CryptoAnalyzer:
         """
         self.data = data
         
+        # Map each symbol to the position of its first row for O(1) lookups
+        symbols = self.data['symbol']
+        first = ~symbols.duplicated().to_numpy()
+        self._by_symbol = dict(zip(symbols.to_numpy()[first], np.flatnonzero(first)))
+        
+        # Sorted row positions per (column, largest), built lazily by _top_k
+        self._sorted_idx = {}
+        
+        # Column arrays backing get_statistics_by_symbol, captured on first use
+        self._stat_arrays = None
+        
+    def _top_k(self, col: str, n: int, largest: bool = True) -> pd.DataFrame:
+        """
+        Select the n rows with the largest (or smallest) values in a column
+        
+        The stable argsort of each column is computed on first use and cached,
+        so repeated top-k queries on the same column are a slice. NaN values
+        sort last and ties keep row order, matching DataFrame.nlargest/nsmallest.
+        
+        Args:
+            col: Column to rank by
+            n: Number of rows to return
+            largest: Whether to return the largest values (else smallest)
+            
+        Returns:
+            DataFrame with the selected rows in ranked order
+        """
+        key = (col, largest)
+        order = self._sorted_idx.get(key)
+        if order is None:
+            arr = self.data[col].to_numpy(dtype=np.float64)
+            order = np.argsort(-arr if largest else arr, kind='stable')
+            self._sorted_idx[key] = order
+        return self.data.iloc[order[:max(n, 0)]]
+    
     def get_top_performers(self, n: int = 10, period: str = '24h') -> pd.DataFrame:
         """
         Get top performing cryptocurrencies by percentage change
@@ -32,7 +67,7 @@ class CryptoAnalyzer:
             DataFrame with top performers
         """
         col = 'chg_24h' if period == '24h' else 'chg_7d'
-        return self.data.nlargest(n, col)[['name', 'symbol', 'price_usd', col, 'market_cap']]
+        return self._top_k(col, n, largest=True)[['name', 'symbol', 'price_usd', col, 'market_cap']]
     
     def get_worst_performers(self, n: int = 10, period: str = '24h') -> pd.DataFrame:
         """
@@ -46,7 +81,7 @@ class CryptoAnalyzer:
             DataFrame with worst performers
         """
         col = 'chg_24h' if period == '24h' else 'chg_7d'
-        return self.data.nsmallest(n, col)[['name', 'symbol', 'price_usd', col, 'market_cap']]
+        return self._top_k(col, n, largest=False)[['name', 'symbol', 'price_usd', col, 'market_cap']]
     
     def get_highest_volume(self, n: int = 10) -> pd.DataFrame:
         """
@@ -58,7 +93,7 @@ class CryptoAnalyzer:
         Returns:
             DataFrame with highest volume coins
         """
-        return self.data.nlargest(n, 'vol_24h')[['name', 'symbol', 'price_usd', 'vol_24h', 'market_cap']]
+        return self._top_k('vol_24h', n, largest=True)[['name', 'symbol', 'price_usd', 'vol_24h', 'market_cap']]
     
     def get_market_overview(self) -> Dict:
         """
@@ -67,14 +102,19 @@ class CryptoAnalyzer:
         Returns:
             Dictionary with market overview statistics
         """
+        market_cap = self.data['market_cap'].to_numpy()
+        vol_24h = self.data['vol_24h'].to_numpy()
+        chg_24h = self.data['chg_24h'].to_numpy()
+        chg_7d = self.data['chg_7d'].to_numpy()
+        
         return {
-            'total_market_cap': self.data['market_cap'].sum(),
-            'total_24h_volume': self.data['vol_24h'].sum(),
-            'avg_24h_change': self.data['chg_24h'].mean(),
-            'avg_7d_change': self.data['chg_7d'].mean(),
+            'total_market_cap': np.nansum(market_cap),
+            'total_24h_volume': np.nansum(vol_24h),
+            'avg_24h_change': np.nanmean(chg_24h, dtype=np.float64),
+            'avg_7d_change': np.nanmean(chg_7d, dtype=np.float64),
             'num_cryptocurrencies': len(self.data),
-            'gainers_24h': len(self.data[self.data['chg_24h'] > 0]),
-            'losers_24h': len(self.data[self.data['chg_24h'] < 0]),
+            'gainers_24h': int(np.count_nonzero(chg_24h > 0)),
+            'losers_24h': int(np.count_nonzero(chg_24h < 0)),
         }
     
     def get_by_price_range(self, min_price: float, max_price: float) -> pd.DataFrame:
@@ -88,8 +128,9 @@ class CryptoAnalyzer:
         Returns:
             DataFrame with cryptocurrencies in the price range
         """
-        mask = (self.data['price_usd'] >= min_price) & (self.data['price_usd'] <= max_price)
-        return self.data[mask][['name', 'symbol', 'price_usd', 'chg_24h', 'market_cap']]
+        price = self.data['price_usd'].to_numpy()
+        rows = np.flatnonzero((price >= min_price) & (price <= max_price))
+        return self.data.iloc[rows][['name', 'symbol', 'price_usd', 'chg_24h', 'market_cap']]
     
     def get_statistics_by_symbol(self, symbol: str) -> Dict:
         """
@@ -101,17 +142,13 @@ class CryptoAnalyzer:
         Returns:
             Dictionary with cryptocurrency statistics
         """
-        crypto = self.data[self.data['symbol'] == symbol.lower()]
-        if crypto.empty:
+        i = self._by_symbol.get(symbol.lower())
+        if i is None:
             return None
         
-        crypto = crypto.iloc[0]
-        return {
-            'name': crypto['name'],
-            'symbol': crypto['symbol'],
-            'price_usd': crypto['price_usd'],
-            'vol_24h': crypto['vol_24h'],
-            'chg_24h': crypto['chg_24h'],
-            'chg_7d': crypto['chg_7d'],
-            'market_cap': crypto['market_cap'],
-        }
+        # Read scalars straight from the column arrays rather than building a
+        # mixed-dtype row Series
+        if self._stat_arrays is None:
+            cols = ['name', 'symbol', 'price_usd', 'vol_24h', 'chg_24h', 'chg_7d', 'market_cap']
+            self._stat_arrays = {col: self.data[col].array for col in cols}
+        return {col: values[i] for col, values in self._stat_arrays.items()}
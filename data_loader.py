@@ -4,23 +4,174 @@ Handles loading and preprocessing of cryptocurrency and stock market data
 """
 
 import pandas as pd
+import numpy as np
 import os
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+def _parse_numeric_bytes(buf, percent, out):
+    """
+    Parse fixed-width ASCII rows of currency/percentage text into floats
+    
+    Row-wise fallback for DataLoader(use_numba=True), compiled with numba when
+    available. Skips $, commas and spaces (plus % when percent is set), applies
+    M/K suffixes for currency values, keeps 'nan' as NaN and maps anything
+    unparseable to 0.0, matching the vectorized pandas parsers.
+    
+    Args:
+        buf: uint8 array of shape (rows, width), NUL padded
+        percent: Whether the rows are percentages (no M/K suffixes)
+        out: float64 array receiving one value per row
+    """
+    for i in range(buf.shape[0]):
+        row = buf[i]
+        end = row.shape[0]
+        while end > 0 and (row[end - 1] == 0 or row[end - 1] == 32):
+            end -= 1
+        
+        mult = 1.0
+        if not percent and end > 0:
+            if row[end - 1] == 77:  # 'M'
+                mult = 1_000_000.0
+                end -= 1
+            elif row[end - 1] == 75:  # 'K'
+                mult = 1_000.0
+                end -= 1
+        
+        mantissa = 0.0
+        frac_digits = 0
+        seen_digit = False
+        seen_dot = False
+        seen_sign = False
+        negative = False
+        letters = 0
+        ok = True
+        for j in range(end):
+            c = row[j]
+            if c == 36 or c == 44 or c == 32 or (percent and (c == 37 or c == 43)):  # $ , space % +
+                continue
+            if 48 <= c <= 57:
+                mantissa = mantissa * 10.0 + (c - 48)
+                seen_digit = True
+                if seen_dot:
+                    frac_digits += 1
+            elif c == 46 and not seen_dot:  # '.'
+                seen_dot = True
+            elif (c == 45 or c == 43) and not (seen_sign or seen_digit or seen_dot):  # - +
+                seen_sign = True
+                negative = c == 45
+            elif (c | 32) == (110, 97, 110)[min(letters, 2)] and letters < 3 and not (seen_digit or seen_dot):
+                letters += 1  # part of a literal 'nan'
+            else:
+                ok = False
+                break
+        
+        if ok and letters == 3 and not seen_digit:
+            out[i] = np.nan
+        elif ok and letters == 0 and seen_digit:
+            value = mantissa / 10.0 ** frac_digits * mult
+            out[i] = -value if negative else value
+        else:
+            out[i] = 0.0
+
+
+if njit is not None:
+    _parse_numeric_bytes = njit(cache=True)(_parse_numeric_bytes)
 
 
 class DataLoader:
     """Load and preprocess financial data from CSV files"""
     
-    def __init__(self, crypto_file: str = "cryptocurrency.csv", stock_file: str = "stocks.csv"):
+    # Columns used by the analyzers; raw currency/percentage columns are read
+    # as strings and cleaned after loading. Prices and percentages are stored
+    # as float32, volumes and market caps stay float64 since they are summed
+    # and displayed to the dollar.
+    CRYPTO_DTYPES = {
+        'name': 'category',
+        'symbol': 'category',
+        'price_usd': 'string',
+        'vol_24h': 'string',
+        'chg_24h': 'string',
+        'chg_7d': 'string',
+        'market_cap': 'string',
+    }
+    STOCK_DTYPES = {
+        'name': 'category',
+        'last': 'float32',
+        'high': 'float32',
+        'low': 'float32',
+        'chg_': 'float32',
+        'chg_%': 'string',
+        'vol_': 'string',
+    }
+    CRYPTO_FLOAT32 = ['price_usd', 'chg_24h', 'chg_7d']
+    
+    # Bump when the cleaned schema changes so stale Parquet caches are ignored
+    CACHE_VERSION = 2
+    
+    def __init__(self, crypto_file: str = "cryptocurrency.csv", stock_file: str = "stocks.csv",
+                 use_cache: bool = True, use_numba: bool = False):
         """
         Initialize DataLoader with file paths
         
         Args:
             crypto_file: Path to cryptocurrency CSV file
             stock_file: Path to stock market CSV file
+            use_cache: Whether to cache cleaned data as Parquet next to the CSV files
+            use_numba: Whether to parse values with the numba-compiled row parser
+                (ignored if numba is not installed)
         """
         self.crypto_file = crypto_file
         self.stock_file = stock_file
+        self.use_cache = use_cache
+        self.use_numba = use_numba and njit is not None
+        self.crypto_cache = f'{crypto_file}.v{self.CACHE_VERSION}.parquet'
+        self.stock_cache = f'{stock_file}.v{self.CACHE_VERSION}.parquet'
+        self._crypto_df = None
+        self._stock_df = None
+        
+    def _read_cache(self, cache_file: str, source_file: str) -> Optional[pd.DataFrame]:
+        """
+        Read cleaned data from a Parquet cache if it is newer than its source
+        
+        Args:
+            cache_file: Path to Parquet cache file
+            source_file: Path to the CSV file the cache was built from
+            
+        Returns:
+            Cached DataFrame, or None if the cache is missing, stale or unreadable
+        """
+        if not self.use_cache or not os.path.exists(cache_file):
+            return None
+        if os.path.getmtime(cache_file) < os.path.getmtime(source_file):
+            return None
+        
+        try:
+            return pd.read_parquet(cache_file, engine='pyarrow')
+        except (OSError, ImportError, ValueError):
+            return None
+    
+    def _write_cache(self, df: pd.DataFrame, cache_file: str):
+        """
+        Write cleaned data to a Parquet cache (failures are ignored)
+        
+        Args:
+            df: Cleaned DataFrame
+            cache_file: Path to Parquet cache file
+        """
+        if not self.use_cache:
+            return
+        
+        try:
+            df.to_parquet(cache_file, engine='pyarrow', compression='zstd')
+        except (OSError, ImportError, ValueError):
+            pass
         
     def _parse_currency_value(self, value: str) -> float:
         """
@@ -32,29 +183,99 @@ class DataLoader:
         Returns:
             Numeric value as float
         """
-        if pd.isna(value):
-            return 0.0
+        return float(self._parse_currency_series(pd.Series([value])).iloc[0])
+    
+    def _parse_currency_series(self, series: pd.Series) -> pd.Series:
+        """
+        Vectorized parse of currency values that may contain $, commas, M, K suffixes
         
-        # Remove $ and spaces
-        value = str(value).replace('$', '').replace(',', '').strip()
+        Args:
+            series: Series of raw currency strings
+            
+        Returns:
+            Series of float values (unparseable entries become 0.0)
+        """
+        if self.use_numba:
+            parsed = self._parse_with_numba(series, percent=False)
+            if parsed is not None:
+                return parsed
         
-        # Handle M (millions) suffix
-        if value.endswith('M'):
-            return float(value[:-1]) * 1_000_000
+        s = series.astype('string').str.replace(r'[$,\s]', '', regex=True)
+        mask_m = s.str.endswith('M').fillna(False).to_numpy(dtype=bool)
+        mask_k = s.str.endswith('K').fillna(False).to_numpy(dtype=bool)
         
-        # Handle K (thousands) suffix
-        if value.endswith('K'):
-            return float(value[:-1]) * 1_000
+        vals = self._to_float(s.str.rstrip('MK'))
+        return vals.where(~mask_m, vals * 1_000_000).where(~mask_k, vals * 1_000)
+    
+    def _parse_percentage_series(self, series: pd.Series) -> pd.Series:
+        """
+        Vectorized parse of percentage values (handles %, +, $0.00 and other edge cases)
         
-        # Regular number
+        Args:
+            series: Series of raw percentage strings
+            
+        Returns:
+            Series of float values (unparseable entries become 0.0)
+        """
+        if self.use_numba:
+            parsed = self._parse_with_numba(series, percent=True)
+            if parsed is not None:
+                return parsed
+        
+        s = series.astype('string').str.replace(r'[%+$,\s]', '', regex=True)
+        return self._to_float(s)
+    
+    def _parse_with_numba(self, series: pd.Series, percent: bool) -> Optional[pd.Series]:
+        """
+        Parse currency or percentage values with the compiled row parser
+        
+        Args:
+            series: Series of raw currency or percentage strings
+            percent: Whether the values are percentages
+            
+        Returns:
+            Series of float64 values, or None if the text is not plain ASCII
+        """
         try:
-            return float(value)
-        except ValueError:
-            return 0.0
+            raw = series.astype('string').fillna('').to_numpy(dtype=object).astype('S')
+        except UnicodeEncodeError:
+            return None
+        
+        buf = raw.view(np.uint8).reshape(len(raw), raw.dtype.itemsize)
+        out = np.empty(len(raw), dtype=np.float64)
+        _parse_numeric_bytes(buf, percent, out)
+        return pd.Series(out, index=series.index)
+    
+    def _to_float(self, s: pd.Series) -> pd.Series:
+        """
+        Convert cleaned strings to float64, mapping missing/invalid entries to 0.0
+        
+        Literal 'nan' strings are kept as NaN, matching the behaviour of float().
+        
+        Args:
+            s: Series of cleaned numeric strings
+            
+        Returns:
+            Series of float64 values
+        """
+        nan_literal = s.str.lower().eq('nan').fillna(False).to_numpy(dtype=bool)
+        vals = pd.to_numeric(s, errors='coerce').fillna(0.0).astype('float64')
+        return vals.mask(nan_literal, np.nan)
     
     def load_crypto_data(self) -> pd.DataFrame:
         """
-        Load cryptocurrency data from CSV
+        Load cryptocurrency data, reusing it if already loaded by this loader
+        
+        Returns:
+            DataFrame containing cryptocurrency data
+        """
+        if self._crypto_df is None:
+            self._crypto_df = self._read_crypto_data()
+        return self._crypto_df
+    
+    def _read_crypto_data(self) -> pd.DataFrame:
+        """
+        Read and clean cryptocurrency data from the Parquet cache or CSV
         
         Returns:
             DataFrame containing cryptocurrency data
@@ -62,32 +283,45 @@ class DataLoader:
         if not os.path.exists(self.crypto_file):
             raise FileNotFoundError(f"Cryptocurrency file not found: {self.crypto_file}")
         
-        df = pd.read_csv(self.crypto_file)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        cached = self._read_cache(self.crypto_cache, self.crypto_file)
+        if cached is not None:
+            return cached
+        
+        df = pd.read_csv(
+            self.crypto_file,
+            usecols=['timestamp', *self.CRYPTO_DTYPES],
+            dtype=self.CRYPTO_DTYPES,
+            parse_dates=['timestamp'],
+            engine='c',
+        )
         
         # Clean currency columns (handle $, commas, M, K suffixes)
-        df['price_usd'] = df['price_usd'].apply(self._parse_currency_value)
-        df['vol_24h'] = df['vol_24h'].apply(self._parse_currency_value)
-        df['market_cap'] = df['market_cap'].apply(self._parse_currency_value)
+        for col in ('price_usd', 'vol_24h', 'market_cap'):
+            df[col] = self._parse_currency_series(df[col])
         
         # Clean percentage columns (handle $0.00 and other edge cases)
-        def parse_percentage(value):
-            if pd.isna(value):
-                return 0.0
-            value = str(value).replace('%', '').replace('+', '').replace('$', '').replace(',', '').strip()
-            try:
-                return float(value)
-            except ValueError:
-                return 0.0
+        for col in ('chg_24h', 'chg_7d'):
+            df[col] = self._parse_percentage_series(df[col])
         
-        df['chg_24h'] = df['chg_24h'].apply(parse_percentage)
-        df['chg_7d'] = df['chg_7d'].apply(parse_percentage)
+        df[self.CRYPTO_FLOAT32] = df[self.CRYPTO_FLOAT32].astype(np.float32)
         
+        self._write_cache(df, self.crypto_cache)
         return df
     
     def load_stock_data(self) -> pd.DataFrame:
         """
-        Load stock market data from CSV
+        Load stock market data, reusing it if already loaded by this loader
+        
+        Returns:
+            DataFrame containing stock market data
+        """
+        if self._stock_df is None:
+            self._stock_df = self._read_stock_data()
+        return self._stock_df
+    
+    def _read_stock_data(self) -> pd.DataFrame:
+        """
+        Read and clean stock market data from the Parquet cache or CSV
         
         Returns:
             DataFrame containing stock market data
@@ -95,8 +329,17 @@ class DataLoader:
         if not os.path.exists(self.stock_file):
             raise FileNotFoundError(f"Stock file not found: {self.stock_file}")
         
-        df = pd.read_csv(self.stock_file)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        cached = self._read_cache(self.stock_cache, self.stock_file)
+        if cached is not None:
+            return cached
+        
+        df = pd.read_csv(
+            self.stock_file,
+            usecols=['timestamp', *self.STOCK_DTYPES],
+            dtype=self.STOCK_DTYPES,
+            parse_dates=['timestamp'],
+            engine='c',
+        )
         
         # Clean volume column (handle M and K suffixes)
         def parse_volume(value):
@@ -115,8 +358,9 @@ class DataLoader:
         df['vol_'] = df['vol_'].apply(parse_volume)
         
         # Clean percentage column
-        df['chg_%'] = df['chg_%'].str.replace('%', '').str.replace('+', '').astype(float)
+        df['chg_%'] = self._parse_percentage_series(df['chg_%']).astype(np.float32)
         
+        self._write_cache(df, self.stock_cache)
         return df
     
     def load_all_data(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -126,6 +370,9 @@ class DataLoader:
         Returns:
             Tuple of (crypto_df, stock_df)
         """
-        crypto_df = self.load_crypto_data()
-        stock_df = self.load_stock_data()
-        return crypto_df, stock_df
+        # The two files are independent and pandas releases the GIL while
+        # parsing, so load them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            crypto_future = executor.submit(self.load_crypto_data)
+            stock_future = executor.submit(self.load_stock_data)
+            return crypto_future.result(), stock_future.result()
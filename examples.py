@@ -3,18 +3,24 @@ Example Usage Script
 Demonstrates how to use individual modules of the fintech platform
 """
 
+from functools import lru_cache
 from data_loader import DataLoader
 from crypto_analyzer import CryptoAnalyzer
 from stock_analyzer import StockAnalyzer
 from portfolio_manager import Portfolio
 
+
+@lru_cache(maxsize=1)
+def _get_data():
+    """Load crypto and stock data once and share it between examples"""
+    return DataLoader().load_all_data()
+
 def example_crypto_analysis():
     """Example: Analyze cryptocurrency data"""
     print("\n=== Cryptocurrency Analysis Example ===\n")
     
     # Load data
-    loader = DataLoader()
-    crypto_data, _ = loader.load_all_data()
+    crypto_data, _ = _get_data()
     
     # Create analyzer
     analyzer = CryptoAnalyzer(crypto_data)
@@ -28,8 +34,8 @@ def example_crypto_analysis():
     # Get top performers
     print("\nTop 5 Performers (24h):")
     top5 = analyzer.get_top_performers(5, '24h')
-    for idx, row in top5.iterrows():
-        print(f"  {row['name']} ({row['symbol']}): {row['chg_24h']:.2f}%")
+    for row in top5.itertuples(index=False):
+        print(f"  {row.name} ({row.symbol}): {row.chg_24h:.2f}%")
     
     # Get Bitcoin statistics
     btc_stats = analyzer.get_statistics_by_symbol('btc')
@@ -45,8 +51,7 @@ def example_stock_analysis():
     print("\n=== Stock Market Analysis Example ===\n")
     
     # Load data
-    loader = DataLoader()
-    _, stock_data = loader.load_all_data()
+    _, stock_data = _get_data()
     
     # Create analyzer
     analyzer = StockAnalyzer(stock_data)
@@ -60,8 +65,8 @@ def example_stock_analysis():
     # Get top gainers
     print("\nTop 5 Gainers:")
     top5 = analyzer.get_top_gainers(5)
-    for idx, row in top5.iterrows():
-        print(f"  {row['name']}: {row['chg_%']:.2f}%")
+    for name, change in zip(top5['name'], top5['chg_%']):
+        print(f"  {name}: {change:.2f}%")
     
     # Get Apple statistics
     apple_stats = analyzer.get_statistics_by_name('Apple')
@@ -101,8 +106,8 @@ def example_portfolio():
     # Get top performers
     print("\nTop Performers:")
     top = portfolio.get_top_performers(2)
-    for idx, row in top.iterrows():
-        print(f"  {row['name']} ({row['type']}): {row['gain_loss_pct']:.2f}%")
+    for row in top.itertuples(index=False):
+        print(f"  {row.name} ({row.type}): {row.gain_loss_pct:.2f}%")
 
 
 if __name__ == "__main__":
@@ -90,15 +90,15 @@ def display_stock_analysis(stock_analyzer: StockAnalyzer):
                    floatfmt=".2f"))
 
 
-def create_sample_portfolio(crypto_data, stock_data):
+def create_sample_portfolio(crypto_analyzer: CryptoAnalyzer, stock_data):
     """Create a sample investment portfolio"""
     print_section_header("SAMPLE PORTFOLIO")
     
     portfolio = Portfolio()
     
     # Add some crypto holdings (using real data from the CSV)
-    btc = crypto_data[crypto_data['symbol'] == 'btc'].iloc[0] if not crypto_data[crypto_data['symbol'] == 'btc'].empty else None
-    eth = crypto_data[crypto_data['symbol'] == 'eth'].iloc[0] if not crypto_data[crypto_data['symbol'] == 'eth'].empty else None
+    btc = crypto_analyzer.get_statistics_by_symbol('btc')
+    eth = crypto_analyzer.get_statistics_by_symbol('eth')
     
     if btc is not None:
         portfolio.add_holding('crypto', btc['name'], btc['symbol'], 0.5, 
@@ -108,16 +108,22 @@ def create_sample_portfolio(crypto_data, stock_data):
         portfolio.add_holding('crypto', eth['name'], eth['symbol'], 2.0,
                             eth['price_usd'] * 0.85, eth['price_usd'])
     
-    # Add some stock holdings
-    apple = stock_data[stock_data['name'].str.contains('Apple', case=False, na=False)]
-    if not apple.empty:
-        apple = apple.iloc[0]
+    # Add some stock holdings (index distinct names by their first row, in row
+    # order, so each lookup scans a few names instead of every record)
+    first_rows = stock_data['name'].dropna().drop_duplicates()
+    name_index = {name.lower(): label for label, name in first_rows.items()}
+    
+    def find_stock(text):
+        label = next((label for name, label in name_index.items() if text in name), None)
+        return stock_data.loc[label] if label is not None else None
+    
+    apple = find_stock('apple')
+    if apple is not None:
         portfolio.add_holding('stock', apple['name'], 'AAPL', 10,
                             apple['last'] * 0.9, apple['last'])
     
-    nvidia = stock_data[stock_data['name'].str.contains('NVIDIA', case=False, na=False)]
-    if not nvidia.empty:
-        nvidia = nvidia.iloc[0]
+    nvidia = find_stock('nvidia')
+    if nvidia is not None:
         portfolio.add_holding('stock', nvidia['name'], 'NVDA', 5,
                             nvidia['last'] * 0.95, nvidia['last'])
     
@@ -171,6 +177,8 @@ def generate_visualizations(crypto_data, stock_data, portfolio_summary):
         print("Creating portfolio allocation chart...")
         visualizer.plot_portfolio_allocation(portfolio_summary)
     
+    visualizer.close()
+    
     print("\nAll charts saved to 'charts/' directory!")
 
 
@@ -198,7 +206,7 @@ def main():
         display_stock_analysis(stock_analyzer)
         
         # Create sample portfolio
-        portfolio, portfolio_summary = create_sample_portfolio(crypto_data, stock_data)
+        portfolio, portfolio_summary = create_sample_portfolio(crypto_analyzer, stock_data)
         
         # Generate visualizations
         generate_visualizations(crypto_data, stock_data, portfolio_summary)
@@ -3,17 +3,126 @@ Portfolio Manager Module
 Manages investment portfolios combining cryptocurrencies and stocks
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
+from ranking import top_n
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+def _aggregate_holdings(qty, purchase, current, type_code):
+    """
+    Sum portfolio totals in a single loop over the holding arrays
+    
+    Used by Portfolio(use_numba=True), compiled with numba when available, so
+    the summary needs no temporary arrays for the per-holding products.
+    
+    Args:
+        qty: float64 array of quantities
+        purchase: float64 array of purchase prices
+        current: float64 array of current prices
+        type_code: uint8 array of asset type codes (0=crypto, 1=stock)
+        
+    Returns:
+        Tuple of (cost_basis, current_value, gain_loss, crypto_value, stock_value)
+    """
+    cost_basis = 0.0
+    current_value = 0.0
+    gain_loss = 0.0
+    crypto_value = 0.0
+    stock_value = 0.0
+    for i in range(qty.shape[0]):
+        value = qty[i] * current[i]
+        cost_basis += qty[i] * purchase[i]
+        current_value += value
+        gain_loss += (current[i] - purchase[i]) * qty[i]
+        if type_code[i] == 0:
+            crypto_value += value
+        elif type_code[i] == 1:
+            stock_value += value
+    return cost_basis, current_value, gain_loss, crypto_value, stock_value
+
+
+if njit is not None:
+    _aggregate_holdings = njit(cache=True)(_aggregate_holdings)
 
 
 class Portfolio:
     """Manage investment portfolio"""
     
-    def __init__(self):
-        """Initialize empty portfolio"""
-        self.holdings = []
+    def __init__(self, use_numba: bool = False):
+        """
+        Initialize empty portfolio
+        
+        Args:
+            use_numba: Whether to compute summaries with the numba-compiled kernel
+                (ignored if numba is not installed)
+        """
+        self.use_numba = use_numba and njit is not None
+        
+        # Holdings are stored column-wise: one NumPy buffer per numeric field
+        # (grown by doubling) plus Python lists for the text fields
+        self._size = 0
+        self._qty = np.empty(0, dtype=np.float64)
+        self._purchase = np.empty(0, dtype=np.float64)
+        self._current = np.empty(0, dtype=np.float64)
+        self._type_code = np.empty(0, dtype=np.uint8)
+        self._name = []
+        self._symbol = []
+        
+        # Asset type names indexed by type code
+        self._type_names = ['crypto', 'stock']
+        
+        # Derived results (summary, allocation, holdings DataFrame), cleared
+        # whenever holdings change
+        self._cache = {}
+    
+    def _grow(self, extra: int):
+        """
+        Make room for extra holdings, doubling buffer capacity as needed
+        
+        Args:
+            extra: Number of holdings about to be appended
+        """
+        needed = self._size + extra
+        if needed <= self._qty.size:
+            return
+        
+        capacity = max(needed, 2 * self._qty.size, 8)
+        for attr in ('_qty', '_purchase', '_current', '_type_code'):
+            old = getattr(self, attr)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, attr, new)
+    
+    def _encode_type(self, asset_type: str) -> int:
+        """
+        Get the type code for an asset type, registering new types
         
+        Args:
+            asset_type: Type of asset ('crypto', 'stock', ...)
+            
+        Returns:
+            Integer type code
+        """
+        if asset_type not in self._type_names:
+            self._type_names.append(asset_type)
+        return self._type_names.index(asset_type)
+    
+    def _columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get views of the filled part of the numeric buffers
+        
+        Returns:
+            Tuple of (quantity, purchase_price, current_price, type_code) arrays
+        """
+        n = self._size
+        return self._qty[:n], self._purchase[:n], self._current[:n], self._type_code[:n]
+    
     def add_holding(self, asset_type: str, name: str, symbol: str, 
                    quantity: float, purchase_price: float, current_price: float):
         """
@@ -27,20 +136,65 @@ class Portfolio:
             purchase_price: Price at purchase
             current_price: Current market price
         """
-        holding = {
-            'type': asset_type,
-            'name': name,
-            'symbol': symbol,
-            'quantity': quantity,
-            'purchase_price': purchase_price,
-            'current_price': current_price,
-            'cost_basis': quantity * purchase_price,
-            'current_value': quantity * current_price,
-            'gain_loss': (current_price - purchase_price) * quantity,
-            'gain_loss_pct': ((current_price - purchase_price) / purchase_price) * 100
-        }
-        self.holdings.append(holding)
+        self._grow(1)
+        i = self._size
+        self._qty[i] = quantity
+        self._purchase[i] = purchase_price
+        self._current[i] = current_price
+        self._type_code[i] = self._encode_type(asset_type)
+        self._name.append(name)
+        self._symbol.append(symbol)
+        self._size += 1
+        self._cache.clear()
+    
+    def add_holdings(self, asset_types: Sequence[str], names: Sequence[str], symbols: Sequence[str],
+                     quantities, purchase_prices, current_prices):
+        """
+        Add several assets to the portfolio at once
+        
+        Args:
+            asset_types: Type of each asset ('crypto' or 'stock')
+            names: Asset names
+            symbols: Asset symbols/tickers
+            quantities: Array-like of units held
+            purchase_prices: Array-like of prices at purchase
+            current_prices: Array-like of current market prices
+        """
+        qty = np.asarray(quantities, dtype=np.float64).ravel()
+        purchase = np.asarray(purchase_prices, dtype=np.float64).ravel()
+        current = np.asarray(current_prices, dtype=np.float64).ravel()
         
+        n = qty.size
+        if not (purchase.size == current.size == len(asset_types) == len(names) == len(symbols) == n):
+            raise ValueError("All holding arguments must have the same length")
+        if n == 0:
+            return
+        
+        # Encode each distinct asset type once, then map back to every row
+        types, inverse = np.unique(np.asarray(asset_types, dtype=str), return_inverse=True)
+        codes = np.array([self._encode_type(t) for t in types], dtype=np.uint8)[inverse]
+        
+        self._grow(n)
+        end = self._size + n
+        self._qty[self._size:end] = qty
+        self._purchase[self._size:end] = purchase
+        self._current[self._size:end] = current
+        self._type_code[self._size:end] = codes
+        self._name.extend(names)
+        self._symbol.extend(symbols)
+        self._size = end
+        self._cache.clear()
+    
+    @property
+    def holdings(self) -> List[Dict]:
+        """
+        Holdings as a list of dictionaries (read-only snapshot)
+        
+        Returns:
+            List with one dictionary per holding
+        """
+        return self._holdings_frame().to_dict('records')
+    
     def get_portfolio_summary(self) -> Dict:
         """
         Get portfolio summary statistics
@@ -48,7 +202,18 @@ class Portfolio:
         Returns:
             Dictionary with portfolio statistics
         """
-        if not self.holdings:
+        if 'summary' not in self._cache:
+            self._cache['summary'] = self._compute_summary()
+        return dict(self._cache['summary'])
+    
+    def _compute_summary(self) -> Dict:
+        """
+        Compute portfolio summary statistics from the holding arrays
+        
+        Returns:
+            Dictionary with portfolio statistics
+        """
+        if not self._size:
             return {
                 'total_cost_basis': 0,
                 'total_current_value': 0,
@@ -57,16 +222,28 @@ class Portfolio:
                 'num_holdings': 0,
             }
         
-        df = pd.DataFrame(self.holdings)
+        qty, purchase, current, type_code = self._columns()
+        if self.use_numba:
+            # Keep NumPy scalars so the results behave like the array path
+            totals = _aggregate_holdings(qty, purchase, current, type_code)
+            cost_basis, total_value, gain_loss, crypto_value, stock_value = map(np.float64, totals)
+        else:
+            cost_basis = (qty * purchase).sum()
+            current_value = qty * current
+            total_value = current_value.sum()
+            gain_loss = ((current - purchase) * qty).sum()
+            
+            # Per-type value totals in a single pass over the type codes
+            crypto_value, stock_value = np.bincount(type_code, weights=current_value, minlength=2)[:2]
         
         return {
-            'total_cost_basis': df['cost_basis'].sum(),
-            'total_current_value': df['current_value'].sum(),
-            'total_gain_loss': df['gain_loss'].sum(),
-            'total_gain_loss_pct': (df['gain_loss'].sum() / df['cost_basis'].sum()) * 100,
-            'num_holdings': len(self.holdings),
-            'crypto_value': df[df['type'] == 'crypto']['current_value'].sum(),
-            'stock_value': df[df['type'] == 'stock']['current_value'].sum(),
+            'total_cost_basis': cost_basis,
+            'total_current_value': total_value,
+            'total_gain_loss': gain_loss,
+            'total_gain_loss_pct': (gain_loss / cost_basis) * 100,
+            'num_holdings': self._size,
+            'crypto_value': crypto_value,
+            'stock_value': stock_value,
         }
     
     def get_holdings_dataframe(self) -> pd.DataFrame:
@@ -76,9 +253,47 @@ class Portfolio:
         Returns:
             DataFrame with all holdings
         """
-        if not self.holdings:
+        # Shallow copy: callers get their own frame object while sharing the
+        # cached column data, which copy-on-write protects from their edits
+        return self._holdings_frame().copy(deep=False)
+    
+    def _holdings_frame(self) -> pd.DataFrame:
+        """
+        Get the cached holdings DataFrame, building it if holdings changed
+        
+        Returns:
+            DataFrame with all holdings (shared; callers must not modify it)
+        """
+        if 'df' not in self._cache:
+            self._cache['df'] = self._build_holdings_frame()
+        return self._cache['df']
+    
+    def _build_holdings_frame(self) -> pd.DataFrame:
+        """
+        Build a DataFrame of the holdings from the column arrays
+        
+        Returns:
+            DataFrame with all holdings
+        """
+        if not self._size:
             return pd.DataFrame()
-        return pd.DataFrame(self.holdings)
+        
+        qty, purchase, current, type_code = self._columns()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            gain_loss_pct = ((current - purchase) / purchase) * 100
+        
+        return pd.DataFrame({
+            'type': pd.Categorical.from_codes(type_code, categories=list(self._type_names)),
+            'name': self._name,
+            'symbol': self._symbol,
+            'quantity': qty,
+            'purchase_price': purchase,
+            'current_price': current,
+            'cost_basis': qty * purchase,
+            'current_value': qty * current,
+            'gain_loss': (current - purchase) * qty,
+            'gain_loss_pct': gain_loss_pct,
+        })
     
     def get_asset_allocation(self) -> Dict:
         """
@@ -87,15 +302,15 @@ class Portfolio:
         Returns:
             Dictionary with allocation percentages
         """
-        if not self.holdings:
+        if not self._size:
             return {}
         
-        df = pd.DataFrame(self.holdings)
-        total_value = df['current_value'].sum()
+        summary = self.get_portfolio_summary()
+        total_value = summary['total_current_value']
         
         allocation = {
-            'crypto_pct': (df[df['type'] == 'crypto']['current_value'].sum() / total_value) * 100,
-            'stock_pct': (df[df['type'] == 'stock']['current_value'].sum() / total_value) * 100,
+            'crypto_pct': (summary['crypto_value'] / total_value) * 100,
+            'stock_pct': (summary['stock_value'] / total_value) * 100,
         }
         
         return allocation
@@ -110,11 +325,12 @@ class Portfolio:
         Returns:
             DataFrame with top performers
         """
-        if not self.holdings:
+        if not self._size:
             return pd.DataFrame()
         
-        df = pd.DataFrame(self.holdings)
-        return df.nlargest(n, 'gain_loss_pct')[['name', 'type', 'quantity', 'gain_loss', 'gain_loss_pct']]
+        df = self._holdings_frame()
+        idx = top_n(df['gain_loss_pct'].to_numpy(), n)
+        return df.iloc[idx][['name', 'type', 'quantity', 'gain_loss', 'gain_loss_pct']]
     
     def get_worst_performers(self, n: int = 5) -> pd.DataFrame:
         """
@@ -126,8 +342,9 @@ class Portfolio:
         Returns:
             DataFrame with worst performers
         """
-        if not self.holdings:
+        if not self._size:
             return pd.DataFrame()
         
-        df = pd.DataFrame(self.holdings)
-        return df.nsmallest(n, 'gain_loss_pct')[['name', 'type', 'quantity', 'gain_loss', 'gain_loss_pct']]
+        df = self._holdings_frame()
+        idx = top_n(df['gain_loss_pct'].to_numpy(), n, largest=False)
+        return df.iloc[idx][['name', 'type', 'quantity', 'gain_loss', 'gain_loss_pct']]
@@ -0,0 +1,59 @@
+"""
+Ranking Module
+Top-N selection helpers shared by the analyzers, portfolio and visualizer
+"""
+
+import numpy as np
+
+
+def top_n(values, n: int, largest: bool = True) -> np.ndarray:
+    """
+    Get positions of the n largest (or smallest) values
+    
+    Uses np.partition to find the cut-off value in linear time, then sorts
+    only the selected candidates. The result matches DataFrame.nlargest /
+    nsmallest: ties keep row order and NaN values are only used, in row
+    order, to pad the result when there are fewer than n valid values.
+    
+    Args:
+        values: Array-like of numeric values
+        n: Number of positions to return
+        largest: Whether to select the largest values (else smallest)
+        
+    Returns:
+        Integer positions of the selected values in ranked order
+    """
+    values = np.asarray(values)
+    if values.dtype.kind != 'f':
+        values = values.astype(np.float64)
+    n = min(max(n, 0), values.size)
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+    
+    # NaN never ranks; it only pads the result when valid values run out
+    nan = np.isnan(values)
+    valid = None
+    if nan.any():
+        valid = np.flatnonzero(~nan)
+        if n >= valid.size:
+            key = values[valid]
+            ranked = valid[np.argsort(-key if largest else key, kind='stable')]
+            return np.concatenate([ranked, np.flatnonzero(nan)[:n - valid.size]])
+        values = values[valid]
+    
+    # Cut-off value in linear time, then everything strictly better than it
+    # plus the earliest ties
+    if largest:
+        kth = np.partition(values, values.size - n)[values.size - n]
+        better = np.flatnonzero(values > kth)
+    else:
+        kth = np.partition(values, n - 1)[n - 1]
+        better = np.flatnonzero(values < kth)
+    tied = np.flatnonzero(values == kth)[:n - better.size]
+    selected = np.sort(np.concatenate([better, tied]))
+    
+    key = values[selected]
+    order = np.argsort(-key if largest else key, kind='stable')
+    if valid is not None:
+        selected = valid[selected]
+    return selected[order]
@@ -6,19 +6,89 @@ Provides analysis functions for stock market data
 import pandas as pd
 import numpy as np
 from typing import Dict, List
+from ranking import top_n
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = None
+    prange = range
+
+
+def _market_totals(last, chg, vol):
+    """
+    Reduce the market overview columns in one loop, skipping NaN values
+    
+    Used by StockAnalyzer(use_numba=True) on large frames. When numba is
+    available the loop is compiled with parallel=True, so prange splits the
+    rows across threads and combines their partial sums and counts.
+    
+    Args:
+        last: Array of last prices
+        chg: Array of percentage changes
+        vol: Array of volumes
+        
+    Returns:
+        Tuple of (price_sum, price_count, chg_sum, chg_count, vol_sum,
+        gainers, losers, unchanged)
+    """
+    price_sum = 0.0
+    price_count = 0
+    chg_sum = 0.0
+    chg_count = 0
+    vol_sum = 0.0
+    gainers = 0
+    losers = 0
+    unchanged = 0
+    for i in prange(last.shape[0]):
+        if not np.isnan(last[i]):
+            price_sum += last[i]
+            price_count += 1
+        if not np.isnan(vol[i]):
+            vol_sum += vol[i]
+        c = chg[i]
+        if c > 0:
+            gainers += 1
+            chg_sum += c
+            chg_count += 1
+        elif c < 0:
+            losers += 1
+            chg_sum += c
+            chg_count += 1
+        elif c == 0:
+            unchanged += 1
+            chg_count += 1
+    return price_sum, price_count, chg_sum, chg_count, vol_sum, gainers, losers, unchanged
+
+
+if njit is not None:
+    _market_totals = njit(parallel=True, cache=True)(_market_totals)
 
 
 class StockAnalyzer:
     """Analyze stock market data"""
     
-    def __init__(self, data: pd.DataFrame):
+    # Below this many rows thread start-up outweighs the parallel speedup
+    PARALLEL_MIN_ROWS = 10_000
+    
+    def __init__(self, data: pd.DataFrame, use_numba: bool = False):
         """
         Initialize with stock data
         
         Args:
             data: DataFrame containing stock data
+            use_numba: Whether to compute the market overview with the parallel
+                numba kernel on large frames (ignored if numba is not installed)
         """
         self.data = data
+        self.use_numba = use_numba and njit is not None
+        
+        # Map each lowercased name to the position of its first row for O(1)
+        # lookups; insertion order follows the rows, so scanning the keys for
+        # a substring finds the same first row as scanning the whole column
+        names = self.data['name'].str.lower()
+        first = ~names.duplicated().to_numpy()
+        self._by_name = dict(zip(names.to_numpy()[first], np.flatnonzero(first)))
         
     def get_top_gainers(self, n: int = 10) -> pd.DataFrame:
         """
@@ -30,7 +100,8 @@ class StockAnalyzer:
         Returns:
             DataFrame with top gaining stocks
         """
-        return self.data.nlargest(n, 'chg_%')[['name', 'last', 'chg_', 'chg_%', 'vol_', 'high', 'low']]
+        idx = top_n(self.data['chg_%'].to_numpy(), n)
+        return self.data.iloc[idx][['name', 'last', 'chg_', 'chg_%', 'vol_', 'high', 'low']]
     
     def get_top_losers(self, n: int = 10) -> pd.DataFrame:
         """
@@ -42,7 +113,8 @@ class StockAnalyzer:
         Returns:
             DataFrame with worst performing stocks
         """
-        return self.data.nsmallest(n, 'chg_%')[['name', 'last', 'chg_', 'chg_%', 'vol_', 'high', 'low']]
+        idx = top_n(self.data['chg_%'].to_numpy(), n, largest=False)
+        return self.data.iloc[idx][['name', 'last', 'chg_', 'chg_%', 'vol_', 'high', 'low']]
     
     def get_highest_volume(self, n: int = 10) -> pd.DataFrame:
         """
@@ -54,7 +126,8 @@ class StockAnalyzer:
         Returns:
             DataFrame with highest volume stocks
         """
-        return self.data.nlargest(n, 'vol_')[['name', 'last', 'chg_%', 'vol_', 'high', 'low']]
+        idx = top_n(self.data['vol_'].to_numpy(), n)
+        return self.data.iloc[idx][['name', 'last', 'chg_%', 'vol_', 'high', 'low']]
     
     def get_market_overview(self) -> Dict:
         """
@@ -63,14 +136,35 @@ class StockAnalyzer:
         Returns:
             Dictionary with market overview statistics
         """
+        # Read each column once as an array; losers/unchanged/gainers come
+        # from a single bincount over the sign of each change, with NaN
+        # changes falling into a fourth bin that is ignored
+        last = self.data['last'].to_numpy()
+        chg = self.data['chg_%'].to_numpy()
+        vol = self.data['vol_'].to_numpy()
+        
+        if self.use_numba and len(self.data) >= self.PARALLEL_MIN_ROWS:
+            (price_sum, price_count, chg_sum, chg_count, vol_sum,
+             gainers, losers, unchanged) = _market_totals(last, chg, vol)
+            # Averages keep the column dtype, as np.nanmean does
+            avg_price = last.dtype.type(price_sum / price_count if price_count else np.nan)
+            avg_change = chg.dtype.type(chg_sum / chg_count if chg_count else np.nan)
+            total_volume = vol.dtype.type(vol_sum)
+        else:
+            sign = np.nan_to_num(np.sign(chg), nan=2.0).astype(np.int8) + 1
+            losers, unchanged, gainers = np.bincount(sign, minlength=4)[:3]
+            avg_price = np.nanmean(last)
+            avg_change = np.nanmean(chg)
+            total_volume = np.nansum(vol)
+        
         return {
             'total_stocks': len(self.data),
-            'avg_price': self.data['last'].mean(),
-            'avg_change': self.data['chg_%'].mean(),
-            'total_volume': self.data['vol_'].sum(),
-            'gainers': len(self.data[self.data['chg_%'] > 0]),
-            'losers': len(self.data[self.data['chg_%'] < 0]),
-            'unchanged': len(self.data[self.data['chg_%'] == 0]),
+            'avg_price': avg_price,
+            'avg_change': avg_change,
+            'total_volume': total_volume,
+            'gainers': int(gainers),
+            'losers': int(losers),
+            'unchanged': int(unchanged),
         }
     
     def get_by_price_range(self, min_price: float, max_price: float) -> pd.DataFrame:
@@ -97,11 +191,16 @@ class StockAnalyzer:
         Returns:
             Dictionary with stock statistics
         """
-        stock = self.data[self.data['name'].str.contains(name, case=False, na=False)]
-        if stock.empty:
-            return None
+        needle = name.lower()
+        i = self._by_name.get(needle)
+        if i is None:
+            # Fall back to a plain substring search over the distinct names
+            i = next((i for lower, i in self._by_name.items()
+                      if isinstance(lower, str) and needle in lower), None)
+            if i is None:
+                return None
         
-        stock = stock.iloc[0]
+        stock = self.data.iloc[i]
         return {
             'name': stock['name'],
             'last': stock['last'],
@@ -122,6 +221,13 @@ class StockAnalyzer:
         Returns:
             DataFrame with most volatile stocks
         """
-        self.data['volatility'] = ((self.data['high'] - self.data['low']) / self.data['last'] * 100)
-        result = self.data.nlargest(n, 'volatility')[['name', 'last', 'high', 'low', 'volatility', 'vol_']]
+        # Computed as a local array so self.data is left untouched
+        high = self.data['high'].to_numpy()
+        low = self.data['low'].to_numpy()
+        last = self.data['last'].to_numpy()
+        volatility = (high - low) / last * 100
+        
+        idx = top_n(volatility, n)
+        result = self.data.iloc[idx][['name', 'last', 'high', 'low', 'vol_']]
+        result.insert(4, 'volatility', volatility[idx])
         return result
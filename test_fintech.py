@@ -3,12 +3,23 @@ Unit Tests for Fintech Platform
 Tests core functionality of data loading and analysis modules
 """
 
+import os
+import tempfile
 import unittest
+from functools import lru_cache
 import pandas as pd
 from data_loader import DataLoader
 from crypto_analyzer import CryptoAnalyzer
 from stock_analyzer import StockAnalyzer
 from portfolio_manager import Portfolio
+from ranking import top_n
+from visualizer import Visualizer
+
+
+@lru_cache(maxsize=1)
+def _load():
+    """Load crypto and stock data once for all test classes"""
+    return DataLoader().load_all_data()
 
 
 class TestDataLoader(unittest.TestCase):
@@ -28,6 +39,27 @@ class TestDataLoader(unittest.TestCase):
         # Test K suffix
         self.assertEqual(loader._parse_currency_value('$250K'), 250000.0)
         
+    def test_parse_series(self):
+        """Test vectorized currency and percentage parsing"""
+        loader = DataLoader()
+        
+        currency = loader._parse_currency_series(pd.Series(['$1,234.56', '$10.5M', '$250K', None, 'bad']))
+        self.assertEqual(currency.tolist(), [1234.56, 10500000.0, 250000.0, 0.0, 0.0])
+        
+        pct = loader._parse_percentage_series(pd.Series(['+1.50%', '-2.25%', '$0.00', None]))
+        self.assertEqual(pct.tolist(), [1.5, -2.25, 0.0, 0.0])
+        
+    def test_parse_series_numba(self):
+        """Test the compiled row parser matches the pandas parser"""
+        values = pd.Series(['$1,234.56', '$10.5M', '$250K', '-$5', 'nan', None, 'bad', '+1.50%'])
+        loader = DataLoader()
+        numba_loader = DataLoader(use_numba=True)
+        
+        pd.testing.assert_series_equal(loader._parse_currency_series(values),
+                                       numba_loader._parse_currency_series(values))
+        pd.testing.assert_series_equal(loader._parse_percentage_series(values),
+                                       numba_loader._parse_percentage_series(values))
+        
     def test_load_crypto_data(self):
         """Test loading cryptocurrency data"""
         loader = DataLoader()
@@ -47,6 +79,10 @@ class TestDataLoader(unittest.TestCase):
         self.assertTrue(pd.api.types.is_numeric_dtype(df['vol_24h']))
         self.assertTrue(pd.api.types.is_numeric_dtype(df['chg_24h']))
         
+        # Check prices are downcast while summed amounts keep full precision
+        self.assertEqual(df['price_usd'].dtype, 'float32')
+        self.assertEqual(df['market_cap'].dtype, 'float64')
+        
     def test_load_stock_data(self):
         """Test loading stock data"""
         loader = DataLoader()
@@ -65,6 +101,25 @@ class TestDataLoader(unittest.TestCase):
         self.assertTrue(pd.api.types.is_numeric_dtype(df['last']))
         self.assertTrue(pd.api.types.is_numeric_dtype(df['chg_%']))
         self.assertTrue(pd.api.types.is_numeric_dtype(df['vol_']))
+        
+    def test_parquet_cache(self):
+        """Test cleaned data is cached as Parquet and reused"""
+        with tempfile.TemporaryDirectory() as tmp:
+            crypto_file = os.path.join(tmp, 'crypto.csv')
+            with open('cryptocurrency.csv') as src, open(crypto_file, 'w') as dst:
+                dst.writelines(src.readline() for _ in range(50))
+            
+            loader = DataLoader(crypto_file=crypto_file)
+            df = loader.load_crypto_data()
+            self.assertTrue(os.path.exists(loader.crypto_cache))
+            
+            cached = DataLoader(crypto_file=crypto_file).load_crypto_data()
+            pd.testing.assert_frame_equal(df, cached)
+            
+    def test_load_is_memoized(self):
+        """Test repeated loads on one loader reuse the same DataFrame"""
+        loader = DataLoader()
+        self.assertIs(loader.load_crypto_data(), loader.load_crypto_data())
 
 
 class TestCryptoAnalyzer(unittest.TestCase):
@@ -73,8 +128,7 @@ class TestCryptoAnalyzer(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Load data once for all tests"""
-        loader = DataLoader()
-        cls.crypto_data, _ = loader.load_all_data()
+        cls.crypto_data, _ = _load()
         cls.analyzer = CryptoAnalyzer(cls.crypto_data)
         
     def test_get_market_overview(self):
@@ -102,6 +156,15 @@ class TestCryptoAnalyzer(unittest.TestCase):
         changes = top_5['chg_24h'].tolist()
         self.assertEqual(changes, sorted(changes, reverse=True))
         
+    def test_top_k_matches_pandas(self):
+        """Test top-k selection matches nlargest/nsmallest ordering"""
+        for col in ['chg_24h', 'chg_7d', 'vol_24h']:
+            expected = self.crypto_data.nlargest(10, col).index
+            self.assertTrue(self.analyzer._top_k(col, 10, largest=True).index.equals(expected))
+            
+            expected = self.crypto_data.nsmallest(10, col).index
+            self.assertTrue(self.analyzer._top_k(col, 10, largest=False).index.equals(expected))
+        
     def test_get_by_price_range(self):
         """Test price range filtering"""
         result = self.analyzer.get_by_price_range(100, 200)
@@ -110,6 +173,14 @@ class TestCryptoAnalyzer(unittest.TestCase):
         for price in result['price_usd']:
             self.assertGreaterEqual(price, 100)
             self.assertLessEqual(price, 200)
+            
+    def test_get_statistics_by_symbol(self):
+        """Test symbol lookup"""
+        stats = self.analyzer.get_statistics_by_symbol('BTC')
+        self.assertEqual(stats['symbol'], 'btc')
+        self.assertEqual(stats['name'], 'Bitcoin')
+        
+        self.assertIsNone(self.analyzer.get_statistics_by_symbol('not-a-coin'))
 
 
 class TestStockAnalyzer(unittest.TestCase):
@@ -118,8 +189,7 @@ class TestStockAnalyzer(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Load data once for all tests"""
-        loader = DataLoader()
-        _, cls.stock_data = loader.load_all_data()
+        _, cls.stock_data = _load()
         cls.analyzer = StockAnalyzer(cls.stock_data)
         
     def test_get_market_overview(self):
@@ -136,6 +206,16 @@ class TestStockAnalyzer(unittest.TestCase):
         self.assertGreater(overview['total_stocks'], 0)
         self.assertGreater(overview['avg_price'], 0)
         
+    def test_market_overview_numba(self):
+        """Test the parallel overview kernel matches the array overview"""
+        expected = self.analyzer.get_market_overview()
+        actual = StockAnalyzer(self.stock_data, use_numba=True).get_market_overview()
+        
+        for key in ['total_stocks', 'gainers', 'losers', 'unchanged']:
+            self.assertEqual(actual[key], expected[key])
+        for key in ['avg_price', 'avg_change', 'total_volume']:
+            self.assertAlmostEqual(actual[key] / expected[key], 1, places=5)
+        
     def test_get_top_gainers(self):
         """Test getting top gainers"""
         top_5 = self.analyzer.get_top_gainers(5)
@@ -146,6 +226,37 @@ class TestStockAnalyzer(unittest.TestCase):
         # Check data is sorted correctly
         changes = top_5['chg_%'].tolist()
         self.assertEqual(changes, sorted(changes, reverse=True))
+        
+    def test_top_n_matches_pandas(self):
+        """Test top-n selection matches nlargest/nsmallest, including ties and NaN"""
+        for col in ['chg_%', 'vol_']:
+            expected = self.stock_data.nlargest(10, col).index
+            self.assertTrue(self.stock_data.iloc[top_n(self.stock_data[col].to_numpy(), 10)].index.equals(expected))
+        
+        values = pd.Series([1.0, float('nan'), 3.0, 3.0, 1.0])
+        self.assertEqual(top_n(values, 2).tolist(), values.nlargest(2).index.tolist())
+        self.assertEqual(top_n(values, 3, largest=False).tolist(), values.nsmallest(3).index.tolist())
+        self.assertEqual(top_n(values, 5).tolist(), [2, 3, 0, 4, 1])
+        
+    def test_get_volatile_stocks(self):
+        """Test volatility ranking leaves the source data unchanged"""
+        columns = list(self.stock_data.columns)
+        result = self.analyzer.get_volatile_stocks(5)
+        
+        self.assertEqual(list(result.columns), ['name', 'last', 'high', 'low', 'volatility', 'vol_'])
+        volatility = result['volatility'].tolist()
+        self.assertEqual(volatility, sorted(volatility, reverse=True))
+        self.assertEqual(list(self.stock_data.columns), columns)
+        
+    def test_get_statistics_by_name(self):
+        """Test exact and partial name lookup"""
+        exact = self.analyzer.get_statistics_by_name('apple')
+        self.assertEqual(exact['name'], 'Apple')
+        
+        partial = self.analyzer.get_statistics_by_name('nvid')
+        self.assertEqual(partial['name'], 'NVIDIA')
+        
+        self.assertIsNone(self.analyzer.get_statistics_by_name('not-a-stock'))
 
 
 class TestPortfolio(unittest.TestCase):
@@ -160,6 +271,11 @@ class TestPortfolio(unittest.TestCase):
         self.assertEqual(len(portfolio.holdings), 1)
         self.assertEqual(portfolio.holdings[0]['name'], 'Bitcoin')
         self.assertEqual(portfolio.holdings[0]['gain_loss'], 10000)
+        self.assertEqual(portfolio.holdings[0]['type'], 'crypto')
+        
+        df = portfolio.get_holdings_dataframe()
+        self.assertIsInstance(df['type'].dtype, pd.CategoricalDtype)
+        self.assertEqual(df['type'].cat.codes.tolist(), [0])
         
     def test_portfolio_summary(self):
         """Test portfolio summary calculation"""
@@ -187,6 +303,93 @@ class TestPortfolio(unittest.TestCase):
         # Check percentages add up to 100
         total_pct = allocation['crypto_pct'] + allocation['stock_pct']
         self.assertAlmostEqual(total_pct, 100, places=1)
+        
+    def test_summary_cache_invalidation(self):
+        """Test cached results refresh after holdings change"""
+        portfolio = Portfolio()
+        
+        portfolio.add_holding('crypto', 'Bitcoin', 'BTC', 1, 50000, 60000)
+        self.assertEqual(portfolio.get_portfolio_summary()['num_holdings'], 1)
+        self.assertEqual(len(portfolio.get_holdings_dataframe()), 1)
+        
+        portfolio.add_holding('stock', 'Apple', 'AAPL', 10, 150, 160)
+        self.assertEqual(portfolio.get_portfolio_summary()['num_holdings'], 2)
+        self.assertEqual(len(portfolio.get_holdings_dataframe()), 2)
+        
+    def test_holdings_dataframe_is_isolated(self):
+        """Test edits to a returned holdings DataFrame do not leak into the portfolio"""
+        portfolio = Portfolio()
+        portfolio.add_holding('crypto', 'Bitcoin', 'BTC', 1, 50000, 60000)
+        
+        df = portfolio.get_holdings_dataframe()
+        df.loc[0, 'quantity'] = 100
+        df['note'] = 'edited'
+        
+        fresh = portfolio.get_holdings_dataframe()
+        self.assertEqual(fresh.loc[0, 'quantity'], 1)
+        self.assertNotIn('note', fresh.columns)
+        
+    def test_add_holdings_batch(self):
+        """Test batch adds match adding holdings one at a time"""
+        single = Portfolio()
+        single.add_holding('crypto', 'Bitcoin', 'BTC', 1, 50000, 60000)
+        single.add_holding('stock', 'Apple', 'AAPL', 10, 150, 160)
+        
+        batch = Portfolio()
+        batch.add_holdings(['crypto', 'stock'], ['Bitcoin', 'Apple'], ['BTC', 'AAPL'],
+                           [1, 10], [50000, 150], [60000, 160])
+        
+        self.assertEqual(batch.get_portfolio_summary(), single.get_portfolio_summary())
+        pd.testing.assert_frame_equal(batch.get_holdings_dataframe(), single.get_holdings_dataframe())
+        
+        with self.assertRaises(ValueError):
+            batch.add_holdings(['crypto'], ['Bitcoin'], ['BTC'], [1, 2], [50000], [60000])
+        
+    def test_summary_numba(self):
+        """Test the compiled summary kernel matches the array summary"""
+        portfolios = [Portfolio(), Portfolio(use_numba=True)]
+        for portfolio in portfolios:
+            portfolio.add_holding('crypto', 'Bitcoin', 'BTC', 0.5, 45000, 50000)
+            portfolio.add_holding('stock', 'Apple', 'AAPL', 10, 150, 175)
+            portfolio.add_holding('bond', 'Treasury', 'UST', 3, 100, 98)
+        
+        expected, actual = (portfolio.get_portfolio_summary() for portfolio in portfolios)
+        for key, value in expected.items():
+            self.assertAlmostEqual(actual[key], value)
+        
+    def test_many_holdings(self):
+        """Test storage grows past its initial capacity"""
+        portfolio = Portfolio()
+        
+        for i in range(20):
+            portfolio.add_holding('crypto' if i % 2 else 'stock', f'Asset {i}', f'A{i}', 1, 10, 10 + i)
+        
+        summary = portfolio.get_portfolio_summary()
+        holdings_df = portfolio.get_holdings_dataframe()
+        
+        self.assertEqual(summary['num_holdings'], 20)
+        self.assertEqual(len(holdings_df), 20)
+        self.assertEqual(holdings_df['name'].iloc[-1], 'Asset 19')
+        self.assertEqual(summary['total_gain_loss'], sum(range(20)))
+        self.assertEqual(summary['crypto_value'], holdings_df.loc[holdings_df['type'] == 'crypto', 'current_value'].sum())
+
+
+
+class TestVisualizer(unittest.TestCase):
+    """Test chart generation"""
+    
+    def test_render_all(self):
+        """Test all charts are written, serially and from a process pool"""
+        crypto_data, stock_data = _load()
+        summary = {'crypto_value': 30000, 'stock_value': 1750}
+        expected = ['crypto_price_distribution.png', 'portfolio_allocation.png', 'stock_performance.png',
+                    'top_cryptos_market_cap.png', 'volume_comparison.png']
+        
+        for processes in [1, 2]:
+            with tempfile.TemporaryDirectory() as tmp:
+                Visualizer(tmp, fast=True).render_all(crypto_data.head(500), stock_data.head(500),
+                                                      summary, processes=processes)
+                self.assertEqual(sorted(os.listdir(tmp)), expected)
 
 
 if __name__ == '__main__':
@@ -3,23 +3,50 @@ Visualization Module
 Create charts and visualizations for financial data
 """
 
+import matplotlib
+matplotlib.use('Agg')  # charts are only written to files; skip GUI backend probing
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+from ranking import top_n
+
+
+def _render_chart(output_dir: str, fast: bool, method: str, args: tuple):
+    """
+    Render one chart in a worker process
+    
+    Args:
+        output_dir: Directory to save the chart image
+        fast: Whether to use the fast save mode
+        method: Name of the Visualizer plot method to call
+        args: Positional arguments for the plot method
+    """
+    visualizer = Visualizer(output_dir, fast=fast)
+    try:
+        getattr(visualizer, method)(*args)
+    finally:
+        visualizer.close()
 
 
 class Visualizer:
     """Create visualizations for financial data"""
     
-    def __init__(self, output_dir: str = "charts"):
+    def __init__(self, output_dir: str = "charts", fast: bool = False):
         """
         Initialize visualizer
         
         Args:
             output_dir: Directory to save chart images
+            fast: Whether to save charts at 100 dpi without the tight bounding
+                box pass, for batch report generation
         """
         self.output_dir = output_dir
+        self.fast = fast
+        self._dpi = 100 if fast else 300
+        self._bbox = None if fast else 'tight'
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
         
@@ -27,6 +54,89 @@ class Visualizer:
         sns.set_style("whitegrid")
         plt.rcParams['figure.figsize'] = (12, 6)
         
+        # Figures are created on first use and cleared for each new chart,
+        # reusing the figure and its canvas instead of building new ones
+        self._fig = None
+        self._pair_fig = None
+        
+    def _axes(self, figsize=(12, 6)):
+        """
+        Get fresh axes on the shared single-chart figure
+        
+        Args:
+            figsize: Figure size in inches
+            
+        Returns:
+            Tuple of (figure, axes)
+        """
+        if self._fig is None:
+            self._fig = plt.figure(figsize=figsize)
+        else:
+            self._fig.clear()
+            self._fig.set_size_inches(figsize)
+        return self._fig, self._fig.add_subplot()
+        
+    def _paired_axes(self):
+        """
+        Get fresh side-by-side axes on the shared comparison figure
+        
+        Returns:
+            Tuple of (figure, (left axes, right axes))
+        """
+        if self._pair_fig is None:
+            self._pair_fig = plt.figure(figsize=(16, 6))
+        else:
+            self._pair_fig.clear()
+        return self._pair_fig, self._pair_fig.subplots(1, 2)
+        
+    def close(self):
+        """Release the shared figures"""
+        for fig in (self._fig, self._pair_fig):
+            if fig is not None:
+                plt.close(fig)
+        self._fig = None
+        self._pair_fig = None
+        
+    def render_all(self, crypto_data: pd.DataFrame, stock_data: pd.DataFrame,
+                   portfolio_summary: Optional[dict] = None, processes: Optional[int] = None):
+        """
+        Render every chart, in parallel worker processes when possible
+        
+        Each chart is independent, so with several CPUs they are spread over a
+        process pool, one figure per worker. With a single process they are
+        rendered here in turn.
+        
+        Args:
+            crypto_data: Cryptocurrency DataFrame
+            stock_data: Stock DataFrame
+            portfolio_summary: Portfolio summary dictionary (allocation chart is
+                skipped if not given)
+            processes: Number of worker processes (defaults to one per chart,
+                capped at the CPU count)
+        """
+        jobs = [
+            ('plot_top_cryptos_by_market_cap', (crypto_data,)),
+            ('plot_crypto_price_distribution', (crypto_data,)),
+            ('plot_stock_performance', (stock_data,)),
+            ('plot_volume_comparison', (crypto_data, stock_data)),
+        ]
+        if portfolio_summary:
+            jobs.append(('plot_portfolio_allocation', (portfolio_summary,)))
+        
+        if processes is None:
+            processes = min(len(jobs), os.cpu_count() or 1)
+        
+        if processes <= 1:
+            for method, args in jobs:
+                getattr(self, method)(*args)
+            return
+        
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [pool.submit(_render_chart, self.output_dir, self.fast, method, args)
+                       for method, args in jobs]
+            for future in futures:
+                future.result()
+        
     def plot_top_cryptos_by_market_cap(self, data: pd.DataFrame, n: int = 10, save: bool = True):
         """
         Plot top cryptocurrencies by market cap
@@ -36,17 +146,16 @@ class Visualizer:
             n: Number of top cryptos to show
             save: Whether to save the chart
         """
-        top_n = data.nlargest(n, 'market_cap')
+        top_cryptos = data.iloc[top_n(data['market_cap'].to_numpy(), n)]
         
-        plt.figure(figsize=(12, 6))
-        plt.barh(top_n['name'], top_n['market_cap'] / 1e9)
-        plt.xlabel('Market Cap (Billions USD)')
-        plt.title(f'Top {n} Cryptocurrencies by Market Cap')
-        plt.tight_layout()
+        fig, ax = self._axes()
+        ax.barh(top_cryptos['name'], top_cryptos['market_cap'] / 1e9)
+        ax.set_xlabel('Market Cap (Billions USD)')
+        ax.set_title(f'Top {n} Cryptocurrencies by Market Cap')
+        fig.tight_layout()
         
         if save:
-            plt.savefig(f'{self.output_dir}/top_cryptos_market_cap.png', dpi=300, bbox_inches='tight')
-        plt.close()
+            fig.savefig(f'{self.output_dir}/top_cryptos_market_cap.png', dpi=self._dpi, bbox_inches=self._bbox)
         
     def plot_crypto_price_distribution(self, data: pd.DataFrame, save: bool = True):
         """
@@ -56,17 +165,16 @@ class Visualizer:
             data: Cryptocurrency DataFrame
             save: Whether to save the chart
         """
-        plt.figure(figsize=(12, 6))
-        plt.hist(data['price_usd'], bins=50, edgecolor='black')
-        plt.xlabel('Price (USD)')
-        plt.ylabel('Frequency')
-        plt.title('Cryptocurrency Price Distribution')
-        plt.yscale('log')
-        plt.tight_layout()
+        fig, ax = self._axes()
+        ax.hist(data['price_usd'], bins=50, edgecolor='black')
+        ax.set_xlabel('Price (USD)')
+        ax.set_ylabel('Frequency')
+        ax.set_title('Cryptocurrency Price Distribution')
+        ax.set_yscale('log')
+        fig.tight_layout()
         
         if save:
-            plt.savefig(f'{self.output_dir}/crypto_price_distribution.png', dpi=300, bbox_inches='tight')
-        plt.close()
+            fig.savefig(f'{self.output_dir}/crypto_price_distribution.png', dpi=self._dpi, bbox_inches=self._bbox)
         
     def plot_stock_performance(self, data: pd.DataFrame, n: int = 10, save: bool = True):
         """
@@ -77,18 +185,17 @@ class Visualizer:
             n: Number of stocks to show
             save: Whether to save the chart
         """
-        top_gainers = data.nlargest(n, 'chg_%')
+        top_gainers = data.iloc[top_n(data['chg_%'].to_numpy(), n)]
         
-        plt.figure(figsize=(12, 6))
+        fig, ax = self._axes()
         colors = ['green' if x > 0 else 'red' for x in top_gainers['chg_%']]
-        plt.barh(top_gainers['name'], top_gainers['chg_%'], color=colors)
-        plt.xlabel('Change (%)')
-        plt.title(f'Top {n} Stock Gainers')
-        plt.tight_layout()
+        ax.barh(top_gainers['name'], top_gainers['chg_%'], color=colors)
+        ax.set_xlabel('Change (%)')
+        ax.set_title(f'Top {n} Stock Gainers')
+        fig.tight_layout()
         
         if save:
-            plt.savefig(f'{self.output_dir}/stock_performance.png', dpi=300, bbox_inches='tight')
-        plt.close()
+            fig.savefig(f'{self.output_dir}/stock_performance.png', dpi=self._dpi, bbox_inches=self._bbox)
         
     def plot_volume_comparison(self, crypto_data: pd.DataFrame, stock_data: pd.DataFrame, 
                               n: int = 10, save: bool = True):
@@ -101,25 +208,24 @@ class Visualizer:
             n: Number of assets to show
             save: Whether to save the chart
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+        fig, (ax1, ax2) = self._paired_axes()
         
         # Crypto volume
-        top_crypto = crypto_data.nlargest(n, 'vol_24h')
+        top_crypto = crypto_data.iloc[top_n(crypto_data['vol_24h'].to_numpy(), n)]
         ax1.barh(top_crypto['name'], top_crypto['vol_24h'] / 1e6)
         ax1.set_xlabel('24h Volume (Millions USD)')
         ax1.set_title(f'Top {n} Cryptocurrencies by Volume')
         
         # Stock volume
-        top_stock = stock_data.nlargest(n, 'vol_')
+        top_stock = stock_data.iloc[top_n(stock_data['vol_'].to_numpy(), n)]
         ax2.barh(top_stock['name'], top_stock['vol_'] / 1e6)
         ax2.set_xlabel('Volume (Millions)')
         ax2.set_title(f'Top {n} Stocks by Volume')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save:
-            plt.savefig(f'{self.output_dir}/volume_comparison.png', dpi=300, bbox_inches='tight')
-        plt.close()
+            fig.savefig(f'{self.output_dir}/volume_comparison.png', dpi=self._dpi, bbox_inches=self._bbox)
         
     def plot_portfolio_allocation(self, portfolio_summary: dict, save: bool = True):
         """
@@ -136,10 +242,9 @@ class Visualizer:
         labels = ['Cryptocurrency', 'Stocks']
         colors = ['#FF9800', '#2196F3']
         
-        plt.figure(figsize=(8, 8))
-        plt.pie(values, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors)
-        plt.title('Portfolio Asset Allocation')
+        fig, ax = self._axes(figsize=(8, 8))
+        ax.pie(values, labels=labels, autopct='%1.1f%%', startangle=90, colors=colors)
+        ax.set_title('Portfolio Asset Allocation')
         
         if save:
-            plt.savefig(f'{self.output_dir}/portfolio_allocation.png', dpi=300, bbox_inches='tight')
-        plt.close()
+            fig.savefig(f'{self.output_dir}/portfolio_allocation.png', dpi=self._dpi, bbox_inches=self._bbox)